@@ -1,8 +1,7 @@
 """
-a worker is Runnable object that for each task, it will create a new thread to run the task.
+a worker is Runnable object that for each task, it will run the task in a thread off the event loop.
 """
 import asyncio
-import threading
 from service.llm_service import get_llm_service_instance
 from util.agent_logger import logger
 
@@ -23,11 +22,8 @@ class Worker:
         self._task.system_prompt = self._llm_service.get_prompt(f"{self._prefix}_system_prompt")
         self._task.user_prompt = self._llm_service.build_user_prompt(prompt_dict, f"{self._prefix}_user_prompt")
         self._task.result = None
-        self._thread = threading.Thread(target=self.run)
-        self._thread.start()
-        while not self._task.result:
-            await asyncio.sleep(0.1)
-        self._thread.join()
+        # the LLM call blocks, so run it in the default thread pool and await it
+        await asyncio.to_thread(self.run)
         return self._task.result
 
     def run(self):
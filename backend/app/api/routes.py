@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import hashlib
 from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
@@ -14,19 +15,27 @@ from database import get_db, engine
 from user.auth import authenticate_user, create_access_token, verify_access_token
 from agile.worker import Translator, Composer
 from api.models import SearchPromptsRequest, SearchPromptsResponse
-from service.llm_service import PromptTemplates
+from service.llm_service import get_prompt_templates_instance
 # Initialize the router
 router = APIRouter()
 
 # TTL cache: key is track_id, value is websocket message
 g_msg_cache = TTLCache(maxsize=100, ttl=600)
 g_ws_manager = ws_util.ConnectionManager()
+# TTL cache: key is worker + hash of prompt parameters, value is the LLM result, so repeated requests skip the LLM call
+g_result_cache = TTLCache(maxsize=256, ttl=600)
+# longer inputs are unlikely to repeat, so they are not worth holding in the result cache
+MAX_CACHED_INPUT_LENGTH = 4096
 
 debug_flag = os.getenv("DEBUG_FLAG", False)
 
-# Route to get a token
+# Constant replies are serialized once instead of on every websocket message
+INVALID_TOKEN_REPLY = json.dumps({"desc": "Invalid Token or Invitation code.", "code": 401}, indent=2, ensure_ascii=False)
+INVALID_COMMAND_REPLY = json.dumps({"desc": "Invalid command. Use 'translate, summarize, analyze, mindmap'.", "code": 400}, indent=2, ensure_ascii=False)
+
+# Route to get a token; plain def so the sync DB query and bcrypt check run in the threadpool, not on the event loop
 @router.post("/token")
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
 
     user = authenticate_user(db, form_data.username, form_data.password)
     if not user:
@@ -39,10 +48,10 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(
 
 
 @router.post("/prompts/search")
-async def search_prompts(search_prompts_request: SearchPromptsRequest, prompt_templates=Depends(PromptTemplates), db: Session = Depends(get_db)):
+async def search_prompts(search_prompts_request: SearchPromptsRequest, prompt_templates=Depends(get_prompt_templates_instance), db: Session = Depends(get_db)):
     system_prompt_name = f"{search_prompts_request.command}_system_prompt"
     user_prompt_name = f"{search_prompts_request.command}_user_prompt"
-    logger.debug(f"system_prompt_name: {system_prompt_name}, user_prompt_name: {user_prompt_name}")
+    logger.debug("system_prompt_name: %s, user_prompt_name: %s", system_prompt_name, user_prompt_name)
 
     resp = SearchPromptsResponse(
         system_prompt = prompt_templates.get_prompt_tpl(system_prompt_name),
@@ -56,18 +65,37 @@ async def health():
     return {"time": current_time, "state": "up"}
 
 
+# websocket command -> (worker class, extra prompt parameters besides the input text, cacheable)
+# compose is generative, so a repeated request should get a fresh answer rather than a cached one
+WORKER_COMMANDS = {
+    "translate": (Translator, {}, True),
+    "compose": (Composer, {"language": "中文"}, False),
+}
+
+async def execute_with_cache(worker_class, prompt_dict: dict) -> str:
+    text = prompt_dict.get("text")
+    if text and len(text) > MAX_CACHED_INPUT_LENGTH:
+        return await worker_class().execute(prompt_dict)
+    prompt_digest = hashlib.sha256(json.dumps(prompt_dict, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    cache_key = f"{worker_class.__name__}:{prompt_digest}"
+    result = g_result_cache.get(cache_key)
+    if result is None:
+        result = await worker_class().execute(prompt_dict)
+        if result:
+            g_result_cache[cache_key] = result
+    return result
+
 @router.websocket("/ws/{username}")
 async def websocket_endpoint(websocket: WebSocket, username: str, token: str):
 
     if token == "202410032143":
-        logger.debug(f"websocket {username} connected")
+        logger.debug("websocket %s connected", username)
     else:
-        logger.debug(f"websocket {username} with token {token} connected")
+        logger.debug("websocket %s with token %s connected", username, token)
         verify_result = verify_access_token(token)
         if (not verify_result) :
-            rs_dict = {"desc": "Invalid Token or Invitation code.", "code": 401}
             await g_ws_manager.connect(websocket, username)
-            await g_ws_manager.send_message(json.dumps(rs_dict, indent=2, ensure_ascii=False), username)
+            await g_ws_manager.send_message(INVALID_TOKEN_REPLY, username)
             await g_ws_manager.disconnect(username)
             return
 
@@ -76,27 +104,29 @@ async def websocket_endpoint(websocket: WebSocket, username: str, token: str):
         while True:
             data = await websocket.receive_text()
             msg = ws_util.build_ws_message(username, data)
-            logger.debug(f"received {data} -> {msg}")
-            if msg.get_command() == "translate":
+            logger.debug("received %s -> %s", data, msg)
+            command = msg.get_command()
+            if command in WORKER_COMMANDS:
                 current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                translator = Translator()
-                await translator.execute({"text": msg.get_field_value("input")})
-                rs_dict = {"time": current_time, "result": translator.get_result(), "code": 200}
+                worker_class, extra_params, cacheable = WORKER_COMMANDS[command]
+                prompt_dict = {"text": msg.get_field_value("input"), **extra_params}
+                try:
+                    if cacheable:
+                        result = await execute_with_cache(worker_class, prompt_dict)
+                    else:
+                        result = await worker_class().execute(prompt_dict)
+                    rs_dict = {"time": current_time, "result": result, "code": 200}
+                except Exception as e:
+                    # an LLM failure (rate limit, timeout, ...) is reported to the client, not allowed to drop the socket
+                    logger.error("%s for %s failed: %s", command, username, e)
+                    rs_dict = {"time": current_time, "desc": f"Failed to {command}, please retry later.", "code": 500}
                 await g_ws_manager.send_message(json.dumps(rs_dict, indent=2, ensure_ascii=False), username)
-            elif  msg.get_command() == "compose":
-                composer = Composer()
-                await composer.execute({"text": msg.get_field_value("input"), "language": "中文"})
-                rs_dict = {"time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "result": composer.get_result(),
-                    "code": 200}
-                await g_ws_manager.send_message(json.dumps(rs_dict, indent=2, ensure_ascii=False), username)
-            elif  msg.get_command() == "summaize":
+            elif  command == "summaize":
                 active_users = g_ws_manager.get_active_connections()
                 rs_dict = {"users": {', '.join(active_users)}, "code": 200}
                 await g_ws_manager.send_message(json.dumps(rs_dict, indent=2, ensure_ascii=False), username)
             else:
-                rs_dict = {"desc": "Invalid command. Use 'translate, summarize, analyze, mindmap'.", "code": 400}
-                await g_ws_manager.send_message(json.dumps(rs_dict, indent=2, ensure_ascii=False), username)
+                await g_ws_manager.send_message(INVALID_COMMAND_REPLY, username)
     except WebSocketDisconnect:
         g_ws_manager.disconnect(username)
         
\ No newline at end of file
@@ -12,7 +12,8 @@ db_name = os.getenv("DB_NAME")
 SQLALCHEMY_DATABASE_URL = f"mysql+pymysql://{db_user}:{db_pwd}@{db_host}/{db_name}"
 print(f"SQLALCHEMY_DATABASE_URL={SQLALCHEMY_DATABASE_URL}")
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# keep loaded attributes after commit so callers can return new rows without a refresh SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
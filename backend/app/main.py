@@ -6,6 +6,7 @@ load_dotenv()
 from fastapi import Depends, WebSocket
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from prometheus_fastapi_instrumentator import Instrumentator
 from fastapi.security import OAuth2PasswordRequestForm
@@ -15,6 +16,8 @@ from api.routes import router as api_router
 from agile.routes import router as agile_router
 from api.routes import login_for_access_token, websocket_endpoint
 from database import get_db, engine
+from service.llm_service import get_llm_service_instance, load_prompt_config, PROMPT_CONFIG_FILE
+from util.agent_logger import logger
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
@@ -32,6 +35,16 @@ app.add_middleware(
 )
 Instrumentator().instrument(app).expose(app)
 
+@app.on_event("startup")
+async def warmup():
+    # build the shared LLM client and parse the prompt templates before the first request needs them;
+    # a missing LLM config (e.g. LLM_API_KEY) must not stop auth/CRUD/health, so fall back to lazy construction
+    try:
+        load_prompt_config(PROMPT_CONFIG_FILE)
+        get_llm_service_instance()
+    except Exception as e:
+        logger.warning("LLM service warmup failed, it will be created on first use: %s", e)
+
 # Include the routers of sub  modules
 app.include_router(agile_router, prefix="/agile")
 app.include_router(api_router, prefix="/api/v1")
@@ -39,7 +52,7 @@ app.include_router(user_router, prefix="/user")
 
 @app.post("/token")
 async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    return await login_for_access_token(form_data, db)
+    return await run_in_threadpool(login_for_access_token, form_data, db)
 
 @app.websocket("/ws/{name}")
 async def connect(websocket: WebSocket, name: str, token: str):
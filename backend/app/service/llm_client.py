@@ -17,15 +17,14 @@ sys.path.append(os.path.dirname(CURRENT_DIR))
 
 from util.agent_logger import logger
 
+TRUE_STRINGS = frozenset(('yes', 'true', 't', 'y', '1'))
+
 def str2bool(arg):
     if not arg:
         return False
     if isinstance(arg, bool):
         return arg
-    if arg.lower() in ('yes', 'true', 't', 'y', '1'):
-        return True
-    else:
-        return False
+    return arg.lower() in TRUE_STRINGS
 
 class LlmClient:
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os, sys
 import json
+from collections import OrderedDict
 from typing import Type
 from pydantic import BaseModel
 from jinja2 import Template
@@ -13,21 +14,49 @@ from util.yaml_config import YamlConfig
 from util.agent_logger import logger
 
 def list2str(l: list[str]) -> str:
-    rs = ""
-    for item in l:
-        if len(rs) > 0:
-            rs += ", "
-        rs += f"'{item}'"
-    return rs
+    return ", ".join(f"'{item}'" for item in l)
+
+PROMPT_CONFIG_FILE = f"{CURRENT_DIR}/prompt_template.yml"
+PROMPT_CONFIG_CACHE_SIZE = 8
+
+# real path of prompt config file -> ((st_mtime_ns, st_size, st_ino), parsed config), in LRU order
+g_prompt_config_cache: OrderedDict[str, tuple[tuple[int, int, int], dict]] = OrderedDict()
+
+def load_prompt_config(config_file: str) -> dict:
+    # a stat is much cheaper than a YAML parse; re-parse only when the file changed on disk
+    config_path = os.path.realpath(config_file)
+    st = os.stat(config_path)
+    file_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = g_prompt_config_cache.get(config_path)
+    if cached is not None and cached[0] == file_key:
+        g_prompt_config_cache.move_to_end(config_path)
+        return cached[1]
+    config_data = YamlConfig(config_path).get_config_data()
+    g_prompt_config_cache[config_path] = (file_key, config_data)
+    g_prompt_config_cache.move_to_end(config_path)
+    if len(g_prompt_config_cache) > PROMPT_CONFIG_CACHE_SIZE:
+        g_prompt_config_cache.popitem(last=False)
+    return config_data
 
 class PromptTemplates:
 
-    def __init__(self, config_file = f"{CURRENT_DIR}/prompt_template.yml"):
-        self._yaml_config = YamlConfig(config_file)
-        self._prompt_config = self._yaml_config.get_config_data()
+    def __init__(self, config_file = PROMPT_CONFIG_FILE):
+        self._config_file = config_file
+        # prompt name -> (template source, compiled template); recompiled when the source changes
+        self._compiled_templates: dict[str, tuple[str, Template]] = {}
 
     def get_prompt_tpl(self, cmd):
-        return self._prompt_config.get(cmd)
+        return load_prompt_config(self._config_file).get(cmd)
+
+    def get_compiled_tpl(self, cmd) -> Template:
+        # compiling a jinja template is far more expensive than rendering it, so do it once per prompt
+        source = self.get_prompt_tpl(cmd)
+        cached = self._compiled_templates.get(cmd)
+        if cached is not None and cached[0] == source:
+            return cached[1]
+        template = Template(source)
+        self._compiled_templates[cmd] = (source, template)
+        return template
 
 class LlmConfig:
     base_url: str
@@ -45,7 +74,7 @@ class LlmConfig:
         return f"LlmConfig(base_url={self.base_url}, api_key={self.api_key}, model={self.model}, stream={self.stream})"
 
 class LlmService:
-    def __init__(self, llm_config: LlmConfig, prompt_config_file: str = f"{CURRENT_DIR}/prompt_template.yml"):
+    def __init__(self, llm_config: LlmConfig, prompt_config_file: str = PROMPT_CONFIG_FILE):
         self._llm_config = llm_config
         self._llm_client = LlmClient(base_url=llm_config.base_url, api_key=llm_config.api_key, model=llm_config.model)
         self._prompt_templates = PromptTemplates(prompt_config_file)
@@ -63,26 +92,24 @@ class LlmService:
         return self._prompt_templates.get_prompt_tpl(name)
 
     def build_user_prompt(self, data_dict: dict, prompt_name='user_prompt') -> str:
-        user_prompt_tpl = self._prompt_templates.get_prompt_tpl(prompt_name)
-        #logger.debug(f"{prompt_name}: {user_prompt_tpl}")
-        template = Template(user_prompt_tpl)
+        template = self._prompt_templates.get_compiled_tpl(prompt_name)
         rendered_str = template.render(data_dict)
         return rendered_str
 
     def ask_as_str(self, system_prompt, user_prompt) -> str:
-        logger.debug(f"Ask LLM for json: {system_prompt}, {user_prompt}.")
+        logger.debug("Ask LLM for json: %s, %s.", system_prompt, user_prompt)
         return self._llm_client.get_str_response(system_prompt, user_prompt)
 
     def ask_as_json_str(self, system_prompt, user_prompt) -> str:
-        logger.debug(f"Ask LLM for json: {system_prompt}, {user_prompt}.")
+        logger.debug("Ask LLM for json: %s, %s.", system_prompt, user_prompt)
         return self._llm_client.get_json_response(system_prompt, user_prompt)
 
     def ask_as_resp_models(self, system_prompt, user_prompt, user_model: Type[BaseModel]) -> list[BaseModel]:
-        logger.debug(f"Ask LLM for resp models: {system_prompt}, {user_prompt}.")
+        logger.debug("Ask LLM for resp models: %s, %s.", system_prompt, user_prompt)
         return self._llm_client.get_objects_response(system_prompt, user_prompt, user_model) # type: ignore
 
     def ask_as_resp_model(self, system_prompt, user_prompt, user_model: Type[BaseModel]) -> BaseModel:
-        logger.debug(f"Ask LLM for resp model: {system_prompt}, {user_prompt}.")
+        logger.debug("Ask LLM for resp model: %s, %s.", system_prompt, user_prompt)
         return self._llm_client.get_object_response(system_prompt, user_prompt, user_model) # type: ignore
 
     def parse_llm_response(self, response: str) -> dict:
@@ -90,6 +117,15 @@ class LlmService:
         return response_json
 
 
+g_prompt_templates = None
+
+def get_prompt_templates_instance() -> PromptTemplates:
+    # shared instance for FastAPI Depends, so clients cannot choose the config file via query parameters
+    global g_prompt_templates
+    if g_prompt_templates is None:
+        g_prompt_templates = PromptTemplates(PROMPT_CONFIG_FILE)
+    return g_prompt_templates
+
 g_llm_service = None
 
 def get_llm_service_instance(llm_config: LlmConfig = LlmConfig()) -> LlmService:
@@ -6,12 +6,14 @@ class SiliconflowClient:
     def __init__(self, base_url, api_key) -> None:
         self._base_url = base_url
         self._api_key = api_key
+        # one session per client so repeated calls reuse the pooled keep-alive connection
+        self._session = requests.Session()
     def get_model_info(self) -> dict:
         url = f"{self._base_url}/models"
 
         headers = {"Authorization": f"Bearer {self._api_key}"}
 
-        response = requests.request("GET", url, headers=headers)
+        response = self._session.request("GET", url, headers=headers)
 
         return json.loads(response.text)
 
@@ -20,7 +22,7 @@ class SiliconflowClient:
 
         headers = {"Authorization": f"Bearer {self._api_key}"}
 
-        response = requests.request("GET", url, headers=headers)
+        response = self._session.request("GET", url, headers=headers)
 
         return json.loads(response.text)
 
@@ -51,7 +53,7 @@ class SiliconflowClient:
             "Content-Type": "application/json"
         }
 
-        response = requests.request("POST", url, json=payload, headers=headers)
+        response = self._session.request("POST", url, json=payload, headers=headers)
 
         return json.loads(response.text)
 
@@ -12,7 +12,6 @@ def create_user(db: Session, user: domain.UserCreate):
     db_user = models.User(username=user.username, email=user.email, hashed_password=hashed_password)
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 def get_user(db: Session, user_id: int):
@@ -13,7 +13,6 @@ def create_task(task: domain.TaskCreate, db: Session = Depends(get_db)):
     db_task = models.Task(title=task.title, description=task.description)
     db.add(db_task)
     db.commit()
-    db.refresh(db_task)
     return db_task
 
 # Get a task by ID endpoint
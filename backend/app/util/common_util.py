@@ -1,8 +1,5 @@
 
-import os
 import json
-import httpx
-import requests
 from datetime import datetime
 from util.agent_logger import logger
 from util.ws_util import WsMessage
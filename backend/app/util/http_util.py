@@ -1,9 +1,15 @@
 import requests
 import json
+import http.cookiejar
+
+# module-level session so repeated calls reuse pooled keep-alive connections;
+# reject all cookies so one caller's session cookies are never sent on another caller's requests
+g_http_session = requests.Session()
+g_http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
 
 # Get the JWT token
 def get_token(username, password, token_url):
-    response = requests.post(token_url, data={"username": username, "password": password})
+    response = g_http_session.post(token_url, data={"username": username, "password": password})
     if response.status_code == 200:
         return response.json()["access_token"]
     else:
@@ -18,7 +24,7 @@ def get(url, params={}, accessToken="", tokenPrefix = 'Bearer '):
 
     print("{}, {}".format(url, get_headers))
 
-    response = requests.get(url, headers=get_headers, verify=False)
+    response = g_http_session.get(url, headers=get_headers, verify=False)
 
     content = ""
     if response.status_code >= 200 and response.status_code < 300:
@@ -34,7 +40,7 @@ def post(url, post_headers={}, post_datas={}, accessToken=""):
         post_headers["Authorization"] = "Bearer " + accessToken
     print("{}, {}, {}".format(url, post_headers, post_datas))
 
-    response = requests.post(url, headers=post_headers, data=json.dumps(post_datas), verify=False)
+    response = g_http_session.post(url, headers=post_headers, data=json.dumps(post_datas), verify=False)
 
     content = ""
     if response.status_code >= 200 and response.status_code < 300:
@@ -1,4 +1,5 @@
 from fastapi import WebSocket
+import asyncio
 import json
 import sys
 from util.agent_logger import logger
@@ -28,8 +29,15 @@ class ConnectionManager:
             logger.error(f"websocket {name} not found")
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections.values():
-            await connection.send_text(message)
+        # send to all clients concurrently so one slow socket does not delay the rest
+        names = list(self.active_connections.keys())
+        results = await asyncio.gather(*(self.active_connections[name].send_text(message) for name in names),
+                                       return_exceptions=True)
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                # a failed send means the socket is gone, drop it so later broadcasts skip it
+                logger.error(f"websocket {name} broadcast failed: {result}")
+                self.disconnect(name)
 
     def get_active_connections(self):
         return list(self.active_connections.keys())
@@ -38,6 +46,9 @@ class WsMessage:
     """
     Class to hold the message received over web socket
     """
+    # one instance per received message, so skip the per-instance __dict__
+    __slots__ = ("_payload", "_data", "_user", "_command", "_from", "_to", "_seq", "_time")
+
     def __init__(self, payload):
         self._payload = payload
         try:
@@ -4,10 +4,11 @@ import sys
 # refer to https://pyyaml.org/wiki/PyYAMLDocumentation
 from yaml import load, dump
 
+# config files are plain data, so use the safe loader; the C (libyaml) variant when available
 try:
-    from yaml import CLoader as Loader, CDumper as Dumper
+    from yaml import CSafeLoader as Loader, CDumper as Dumper
 except ImportError:
-    from yaml import Loader, Dumper
+    from yaml import SafeLoader as Loader, Dumper
 
 class YamlConfig:
     def __init__(self, yaml_file):
@@ -50,11 +50,11 @@ def init_db():
                 Permission(name="update"),
             ]
             db.add_all(default_permissions)
-            db.commit()  # Commit the permissions first so we can associate them with the role
+            db.flush()  # Flush the permissions first so they get ids to associate with the role
 
-            # Associate all permissions with the default role (Admin)
-            for permission in default_permissions:
-                db.execute(role_permission_table.insert().values(role_id=default_role.id, permission_id=permission.id))
+            # Associate all permissions with the default role (Admin) in one executemany
+            db.execute(role_permission_table.insert(),
+                       [{"role_id": default_role.id, "permission_id": permission.id} for permission in default_permissions])
 
         # Check if any users exist
         if db.query(User).first() is None: